@@ -140,12 +140,12 @@ The 'nodes' table contains the following columns:
     def parse_python_obj(self, data: Any) -> NetworkData:
 
         if isinstance(data, KiaraTables):
-            if EDGES_TABLE_NAME not in data.tables.keys():
+            if EDGES_TABLE_NAME not in data.tables:
                 raise KiaraException(
                     f"Can't import network data: no '{EDGES_TABLE_NAME}' table found"
                 )
 
-            if NODES_TABLE_NAME not in data.tables.keys():
+            if NODES_TABLE_NAME not in data.tables:
                 raise KiaraException(
                     f"Can't import network data: no '{NODES_TABLE_NAME}' table found"
                 )
@@ -12,6 +12,7 @@ from typing import (
     TYPE_CHECKING,
     ClassVar,
     Dict,
+    FrozenSet,
     Iterable,
     List,
     Literal,
@@ -62,6 +63,7 @@ if TYPE_CHECKING:
     import networkx as nx
     import pyarrow as pa
     import rustworkx as rx
+    from bidict import bidict
 
     from kiara_plugin.tabular.models.table import KiaraTable
 
@@ -433,6 +435,12 @@ class NetworkData(KiaraTables):
 
         return self.edges.num_rows
 
+    @property
+    def edge_column_names(self) -> FrozenSet[str]:
+        """Return the set of column names of the edges table."""
+
+        return frozenset(self.edges.arrow_table.schema.names)
+
     def query_edges(
         self, sql_query: str, relation_name: str = EDGES_TABLE_NAME
     ) -> "pa.Table":
@@ -443,13 +451,12 @@ class NetworkData(KiaraTables):
 
         import duckdb
 
-        con = duckdb.connect()
-        edges = self.edges.arrow_table  # noqa: F841
         if relation_name != EDGES_TABLE_NAME:
             sql_query = sql_query.replace(relation_name, EDGES_TABLE_NAME)
 
-        result = con.execute(sql_query)
-        return result.arrow()
+        with duckdb.connect() as con:
+            con.register(EDGES_TABLE_NAME, self.edges.arrow_table)
+            return con.execute(sql_query).arrow()
 
     def query_nodes(
         self, sql_query: str, relation_name: str = NODES_TABLE_NAME
@@ -461,13 +468,12 @@ class NetworkData(KiaraTables):
 
         import duckdb
 
-        con = duckdb.connect()
-        nodes = self.nodes.arrow_table  # noqa
         if relation_name != NODES_TABLE_NAME:
             sql_query = sql_query.replace(relation_name, NODES_TABLE_NAME)
 
-        result = con.execute(sql_query)
-        return result.arrow()
+        with duckdb.connect() as con:
+            con.register(NODES_TABLE_NAME, self.nodes.arrow_table)
+            return con.execute(sql_query).arrow()
 
     def _calculate_node_attributes(
         self, incl_node_attributes: Union[bool, str, Iterable[str]]
@@ -602,24 +608,76 @@ class NetworkData(KiaraTables):
 
         """
 
-        graph: NETWORKX_GRAPH_TYPE = graph_type()
-
-        def add_node(_node_id: int, **attrs):
-            graph.add_node(_node_id, **attrs)
+        import pyarrow.compute as pc
 
-        def add_edge(_source: int, _target: int, **attrs):
-            graph.add_edge(_source, _target, **attrs)
+        graph: NETWORKX_GRAPH_TYPE = graph_type()
 
-        self.retrieve_graph_data(
-            nodes_callback=add_node,
-            edges_callback=add_edge,
-            incl_node_attributes=incl_node_attributes,
-            incl_edge_attributes=incl_edge_attributes,
-            omit_self_loops=omit_self_loops,
+        # nodes and edges are added in bulk, directly from the (projected) Arrow tables, instead of via per-row callbacks
+        node_attr_names = self._calculate_node_attributes(incl_node_attributes)
+        nodes = self.nodes.arrow_table.select(node_attr_names).to_pylist()
+        graph.add_nodes_from((x.pop(NODE_ID_COLUMN_NAME), x) for x in nodes)
+
+        edge_attr_names = self._calculate_edge_attributes(incl_edge_attributes)
+        edges_table = self.edges.arrow_table.select(edge_attr_names)
+        if omit_self_loops:
+            edges_table = edges_table.filter(
+                pc.not_equal(
+                    edges_table.column(SOURCE_COLUMN_NAME),
+                    edges_table.column(TARGET_COLUMN_NAME),
+                )
+            )
+        edges = edges_table.to_pylist()
+        graph.add_edges_from(
+            (x.pop(SOURCE_COLUMN_NAME), x.pop(TARGET_COLUMN_NAME), x) for x in edges
         )
 
         return graph
 
+    def _add_rustworkx_nodes_and_edges(
+        self,
+        graph: RUSTWORKX_GRAPH_TYPE,
+        incl_node_attributes: Union[bool, str, Iterable[str]] = False,
+        incl_edge_attributes: Union[bool, str, Iterable[str]] = False,
+        omit_self_loops: bool = False,
+    ) -> "bidict":
+        """Add all nodes (with their id and attributes as data) and edges (with their attributes as data, if any) to a rustworkx graph in bulk.
+
+        Returns a bidict that maps the rustworkx graph node indexes to the node ids of this network data.
+        """
+
+        import pyarrow.compute as pc
+        from bidict import bidict
+
+        node_attr_names = self._calculate_node_attributes(incl_node_attributes)
+        nodes = self.nodes.arrow_table.select(node_attr_names)
+        graph_node_ids = graph.add_nodes_from(nodes.to_pylist())
+        node_ids = nodes.column(NODE_ID_COLUMN_NAME).to_pylist()
+        node_map = bidict(zip(graph_node_ids, node_ids))
+
+        edge_attr_names = self._calculate_edge_attributes(incl_edge_attributes)
+        edges = self.edges.arrow_table.select(edge_attr_names)
+        if omit_self_loops:
+            edges = edges.filter(
+                pc.not_equal(
+                    edges.column(SOURCE_COLUMN_NAME), edges.column(TARGET_COLUMN_NAME)
+                )
+            )
+        sources = edges.column(SOURCE_COLUMN_NAME).to_pylist()
+        targets = edges.column(TARGET_COLUMN_NAME).to_pylist()
+
+        # in most cases, the node ids are equal to the graph indexes, and we don't need to translate them
+        if list(graph_node_ids) != node_ids:
+            graph_indexes = node_map.inverse
+            sources = [graph_indexes[x] for x in sources]
+            targets = [graph_indexes[x] for x in targets]
+
+        if len(edge_attr_names) == 2:
+            graph.add_edges_from_no_data(list(zip(sources, targets)))
+        else:
+            edge_attrs = edges.select(edge_attr_names[2:]).to_pylist()
+            graph.add_edges_from(list(zip(sources, targets, edge_attrs)))
+        return node_map
+
     def as_rustworkx_graph(
         self,
         graph_type: Type[RUSTWORKX_GRAPH_TYPE],
@@ -644,41 +702,11 @@ class NetworkData(KiaraTables):
             attach_node_id_map: if True, add the dict describing how the rustworkx graph node ids (key) are mapped to the original node id of the network data, under the 'node_id_map' key in the graph's attributes
         """
 
-        from bidict import bidict
-
         graph = graph_type(multigraph=multigraph)
 
-        # rustworkx uses 0-based integer indexes, so we don't neeed to look up the node ids (unless we want to
-        # include node attributes)
-
-        self._calculate_node_attributes(incl_node_attributes)[1:]
-        self._calculate_edge_attributes(incl_edge_attributes)[2:]
-
-        # we can use a 'global' dict here because we know the nodes are processed before the edges
-        node_map: bidict = bidict()
-
-        def add_node(_node_id: int, **attrs):
-            data = {NODE_ID_COLUMN_NAME: _node_id}
-            data.update(attrs)
-
-            graph_node_id = graph.add_node(data)
-
-            node_map[graph_node_id] = _node_id
-            # if not _node_id == graph_node_id:
-            #     raise Exception("Internal error: node ids don't match")
-
-        def add_edge(_source: int, _target: int, **attrs):
-
-            source = node_map[_source]
-            target = node_map[_target]
-            if not attrs:
-                graph.add_edge(source, target, None)
-            else:
-                graph.add_edge(source, target, attrs)
-
-        self.retrieve_graph_data(
-            nodes_callback=add_node,
-            edges_callback=add_edge,
+        # nodes and edges are added in bulk, directly from the (projected) Arrow tables, instead of via per-row callbacks
+        node_map = self._add_rustworkx_nodes_and_edges(
+            graph=graph,
             incl_node_attributes=incl_node_attributes,
             incl_edge_attributes=incl_edge_attributes,
             omit_self_loops=omit_self_loops,
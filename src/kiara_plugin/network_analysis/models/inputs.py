@@ -1,73 +1,86 @@
 # -*- coding: utf-8 -*-
+import re
 from typing import Any, ClassVar, Dict, Union
 
-from pydantic import Field, model_validator
+from pydantic import ConfigDict, Field, model_validator
 
 from kiara.models import KiaraModel
 from kiara_plugin.core_types.defaults import DEFAULT_MODEL_KEY
 from kiara_plugin.network_analysis.defaults import AGGREGATION_FUNCTION_NAME
 
+# matches 'target', 'target=source' and 'target=FUNC(source)' shorthand tokens
+_ATTRIBUTE_MAP_TOKEN_REGEX = re.compile(
+    r"^(?P<target>[^=]*)(?:=(?P<func_token>(?P<func>[^(]*)\((?P<args>.*)|(?P<source>.*)))?$",
+    re.DOTALL,
+)
+
+
+def parse_attribute_map_token(token: str) -> Dict[str, Union[str, None]]:
+    """Parse an attribute map shorthand string into the field values of an 'AttributeMapStrategy'.
+
+    Supported formats: 'target_column_name', 'target_column_name=source_column_name' and 'target_column_name=FUNC(source_column_name)'.
+    """
+
+    # every string matches, malformed function definitions are checked below
+    match = _ATTRIBUTE_MAP_TOKEN_REGEX.match(token)
+    assert match is not None
+
+    target_column_name = match.group("target")
+    func = match.group("func")
+    if func is not None:
+        func = func.strip()
+        args = match.group("args").strip()
+        if not args.endswith(")"):
+            raise ValueError(
+                f"Invalid function definition, missing closing parenthesis: {match.group('func_token')}"
+            )
+        source_column_name = args[:-1].strip()
+        if not source_column_name:
+            raise ValueError(
+                f"Invalid function definition, empty source column name: {match.group('func_token')}. Use like: `{func}(YOUR_SOURCE_COLUMN_NAME)"
+            )
+    else:
+        source_column_name = match.group("source")
+        if source_column_name is not None:
+            source_column_name = source_column_name.strip()
+
+    if not source_column_name:
+        source_column_name = target_column_name
+
+    return {
+        "target_column_name": target_column_name,
+        "source_column_name": source_column_name,
+        "transform_function": func.lower() if func else None,
+    }
+
 
 class AttributeMapStrategy(KiaraModel):
 
     _kiara_model_id: ClassVar = "input.network_analysis_attribute_map_transformation"
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     @model_validator(mode="before")
     @classmethod
     def pre_validate_model(cls, values: Dict[str, Any]):
 
-        if len(values) == 1 and DEFAULT_MODEL_KEY in values.keys():
-
-            token = values[DEFAULT_MODEL_KEY]
-            source_column_name = None
-            if "=" in token:
-
-                target_column_name, func_token = token.split("=", maxsplit=1)
-
-                if "(" in func_token:
-
-                    func, source_column_name = func_token.split("(", maxsplit=1)
-                    if source_column_name == ")":
-                        raise ValueError(
-                            f"Invalid function definition, empty source column name: {func_token}. Use like: `{func}(YOUR_SOURCE_COLUMN_NAME)"
-                        )
-                    source_column_name = source_column_name.strip()
-                    func = func.strip()
-                    if not source_column_name.endswith(")"):
-                        raise ValueError(
-                            f"Invalid function definition, missing closing parenthesis: {func_token}"
-                        )
+        if len(values) == 1 and DEFAULT_MODEL_KEY in values:
+            return parse_attribute_map_token(values[DEFAULT_MODEL_KEY])
 
-                    source_column_name = source_column_name[:-1]
-                else:
-                    source_column_name = func_token.strip()
-                    func = None
-
-            else:
-                target_column_name = token
-                func = None
-
-            if not source_column_name:
-                source_column_name = target_column_name
-            result = {
-                "target_column_name": target_column_name,
-                "source_column_name": source_column_name,
-                "transform_function": func.lower() if func else None,
-            }
-
-            return result
-
-        if not values.get("target_column_name", None):
+        target_column_name = values.get("target_column_name", None)
+        if not target_column_name:
             raise ValueError("No 'target_column_name' specified.")
-        if not values.get("source_column_name", None):
-            values["source_column_name"] = values["target_column_name"]
-
-        values["transform_function"] = (
-            values["transform_function"].lower()
-            if values["transform_function"]
-            else None
-        )
-        return values
+
+        # we don't modify the input mapping, since it might be re-used by the caller
+        transform_function = values.get("transform_function", None)
+        return {
+            **values,
+            "source_column_name": values.get("source_column_name", None)
+            or target_column_name,
+            "transform_function": transform_function.lower()
+            if transform_function
+            else None,
+        }
 
     target_column_name: str = Field(
         description="The name of the attribute in the resulting network_data instance."
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
-from typing import ClassVar
+from typing import ClassVar, Dict, Tuple, Type, TypeVar
 
-from pydantic import Field, field_validator
+from pydantic import ConfigDict, Field, field_validator
 
 from kiara.models import KiaraModel
 from kiara.models.documentation import DocumentationMetadataModel
@@ -28,6 +28,9 @@ class NetworkNodeAttributeMetadata(KiaraModel):
 
     _kiara_model_id: ClassVar = "metadata.network_node_attribute"
 
+    # instances are shared (check 'create_attribute_metadata'), so they must not be mutated
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     doc: DocumentationMetadataModel = Field(
         description="Explanation what this attribute is about.",
         default_factory=DocumentationMetadataModel.create,
@@ -40,6 +43,8 @@ class NetworkNodeAttributeMetadata(KiaraModel):
     @field_validator("doc", mode="before")
     @classmethod
     def validate_doc(cls, value):
+        if isinstance(value, DocumentationMetadataModel):
+            return value
         return DocumentationMetadataModel.create(value)
 
 
@@ -47,6 +52,9 @@ class NetworkEdgeAttributeMetadata(KiaraModel):
 
     _kiara_model_id: ClassVar = "metadata.network_edge_attribute"
 
+    # instances are shared (check 'create_attribute_metadata'), so they must not be mutated
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     doc: DocumentationMetadataModel = Field(
         description="Explanation what this attribute is about.",
         default_factory=DocumentationMetadataModel.create,
@@ -59,39 +67,92 @@ class NetworkEdgeAttributeMetadata(KiaraModel):
     @field_validator("doc", mode="before")
     @classmethod
     def validate_doc(cls, value):
+        if isinstance(value, DocumentationMetadataModel):
+            return value
         return DocumentationMetadataModel.create(value)
 
 
-NODE_ID_COLUMN_METADATA = NetworkNodeAttributeMetadata(doc=NODE_ID_TEXT, computed_attribute=True)  # type: ignore
-NODE_LABEL_COLUMN_METADATA = NetworkNodeAttributeMetadata(doc=NODE_LABEL_TEXT, computed_attribute=True)  # type: ignore
+ATTRIBUTE_METADATA_TYPE = TypeVar(
+    "ATTRIBUTE_METADATA_TYPE",
+    NetworkNodeAttributeMetadata,
+    NetworkEdgeAttributeMetadata,
+)
+
+_ATTRIBUTE_METADATA_CACHE: Dict[Tuple[Type[KiaraModel], str, bool], KiaraModel] = {}
+
+
+def create_attribute_metadata(
+    model_cls: Type[ATTRIBUTE_METADATA_TYPE], doc: str, computed_attribute: bool = True
+) -> ATTRIBUTE_METADATA_TYPE:
+    """Create an attribute metadata instance from a (trusted) documentation string.
 
-NODE_COUNT_EDGES_COLUMN_METADATA = NetworkNodeAttributeMetadata(doc=NODE_COUNT_EDGES_TEXT, computed_attribute=True)  # type: ignore
-NODE_DEGREE_COLUMN_METADATA = NetworkEdgeAttributeMetadata(
-    doc=UNWEIGHTED_DEGREE_CENTRALITY_TEXT, computed_attribute=True
-)  # type: ignore
-NODE_COUND_EDGES_MULTI_COLUMN_METADATA = NetworkNodeAttributeMetadata(doc=NODE_COUNT_EDGES_MULTI_TEXT, computed_attribute=True)  # type: ignore
-NODE_DEGREE_MULTI_COLUMN_METADATA = NetworkEdgeAttributeMetadata(
-    doc=UNWEIGHTED_DEGREE_CENTRALITY_TEXT, computed_attribute=True
-)  # type: ignore
+    Instances are interned, so repeated calls with the same arguments return the same object. Model validation is
+    skipped, which means this should only be used for static metadata, like the module-level constants below.
+    """
 
-NODE_COUNT_IN_EDGES_COLUMN_METADATA = NetworkNodeAttributeMetadata(doc=NODE_COUNT_IN_EDGES_TEXT, computed_attribute=True)  # type: ignore
-NODE_COUNT_IN_EDGES_MULTI_COLUMN_METADATA = NetworkNodeAttributeMetadata(doc=NODE_COUNT_IN_EDGES_MULTI_TEXT, computed_attribute=True)  # type: ignore
-NODE_COUNT_OUT_EDGES_COLUMN_METADATA = NetworkEdgeAttributeMetadata(doc=NODE_COUNT_OUT_EDGES_TEXT, computed_attribute=True)  # type: ignore
-NODE_COUNT_OUT_EDGES_MULTI_COLUMN_METADATA = NetworkEdgeAttributeMetadata(doc=NODE_COUNT_OUT_EDGES_MULTI_TEXT, computed_attribute=True)  # type: ignore
+    key = (model_cls, doc, computed_attribute)
+    metadata = _ATTRIBUTE_METADATA_CACHE.get(key, None)
+    if metadata is None:
+        metadata = model_cls.model_construct(
+            doc=DocumentationMetadataModel.create(doc),
+            computed_attribute=computed_attribute,
+        )
+        _ATTRIBUTE_METADATA_CACHE[key] = metadata
+    return metadata  # type: ignore
 
-EDGE_ID_COLUMN_METADATA = NetworkEdgeAttributeMetadata(doc="The unique id for the edge.", computed_attribute=True)  # type: ignore
-EDGE_SOURCE_COLUMN_METADATA = NetworkEdgeAttributeMetadata(doc=EDGE_SOURCE_TEXT, computed_attribute=True)  # type: ignore
-EDGE_TARGET_COLUMN_METADATA = NetworkEdgeAttributeMetadata(doc=EDGE_TARGET_TEXT, computed_attribute=True)  # type: ignore
 
-EDGE_COUNT_DUP_DIRECTED_COLUMN_METADATA = NetworkEdgeAttributeMetadata(
-    doc=EDGE_COUNT_DUP_DIRECTED_TEXT, computed_attribute=True
+NODE_ID_COLUMN_METADATA = create_attribute_metadata(
+    NetworkNodeAttributeMetadata, NODE_ID_TEXT
+)
+NODE_LABEL_COLUMN_METADATA = create_attribute_metadata(
+    NetworkNodeAttributeMetadata, NODE_LABEL_TEXT
+)
+
+NODE_COUNT_EDGES_COLUMN_METADATA = create_attribute_metadata(
+    NetworkNodeAttributeMetadata, NODE_COUNT_EDGES_TEXT
+)
+NODE_DEGREE_COLUMN_METADATA = create_attribute_metadata(
+    NetworkEdgeAttributeMetadata, UNWEIGHTED_DEGREE_CENTRALITY_TEXT
+)
+NODE_COUND_EDGES_MULTI_COLUMN_METADATA = create_attribute_metadata(
+    NetworkNodeAttributeMetadata, NODE_COUNT_EDGES_MULTI_TEXT
+)
+NODE_DEGREE_MULTI_COLUMN_METADATA = create_attribute_metadata(
+    NetworkEdgeAttributeMetadata, UNWEIGHTED_DEGREE_CENTRALITY_TEXT
+)
+
+NODE_COUNT_IN_EDGES_COLUMN_METADATA = create_attribute_metadata(
+    NetworkNodeAttributeMetadata, NODE_COUNT_IN_EDGES_TEXT
+)
+NODE_COUNT_IN_EDGES_MULTI_COLUMN_METADATA = create_attribute_metadata(
+    NetworkNodeAttributeMetadata, NODE_COUNT_IN_EDGES_MULTI_TEXT
+)
+NODE_COUNT_OUT_EDGES_COLUMN_METADATA = create_attribute_metadata(
+    NetworkEdgeAttributeMetadata, NODE_COUNT_OUT_EDGES_TEXT
+)
+NODE_COUNT_OUT_EDGES_MULTI_COLUMN_METADATA = create_attribute_metadata(
+    NetworkEdgeAttributeMetadata, NODE_COUNT_OUT_EDGES_MULTI_TEXT
+)
+
+EDGE_ID_COLUMN_METADATA = create_attribute_metadata(
+    NetworkEdgeAttributeMetadata, "The unique id for the edge."
+)
+EDGE_SOURCE_COLUMN_METADATA = create_attribute_metadata(
+    NetworkEdgeAttributeMetadata, EDGE_SOURCE_TEXT
+)
+EDGE_TARGET_COLUMN_METADATA = create_attribute_metadata(
+    NetworkEdgeAttributeMetadata, EDGE_TARGET_TEXT
+)
+
+EDGE_COUNT_DUP_DIRECTED_COLUMN_METADATA = create_attribute_metadata(
+    NetworkEdgeAttributeMetadata, EDGE_COUNT_DUP_DIRECTED_TEXT
 )
-EDGE_IDX_DUP_DIRECTED_COLUMN_METADATA = NetworkEdgeAttributeMetadata(
-    doc=EDGE_IDX_DUP_DIRECTED_TEXT, computed_attribute=True
+EDGE_IDX_DUP_DIRECTED_COLUMN_METADATA = create_attribute_metadata(
+    NetworkEdgeAttributeMetadata, EDGE_IDX_DUP_DIRECTED_TEXT
 )
-EDGE_COUNT_DUP_UNDIRECTED_COLUMN_METADATA = NetworkEdgeAttributeMetadata(
-    doc=EDGE_COUNT_DUP_UNDIRECTED_TEXT, computed_attribute=True
+EDGE_COUNT_DUP_UNDIRECTED_COLUMN_METADATA = create_attribute_metadata(
+    NetworkEdgeAttributeMetadata, EDGE_COUNT_DUP_UNDIRECTED_TEXT
 )
-EDGE_IDX_DUP_UNDIRECTED_COLUMN_METADATA = NetworkEdgeAttributeMetadata(
-    doc=EDGE_IDX_DUP_UNDIRECTED_TEXT, computed_attribute=True
+EDGE_IDX_DUP_UNDIRECTED_COLUMN_METADATA = create_attribute_metadata(
+    NetworkEdgeAttributeMetadata, EDGE_IDX_DUP_UNDIRECTED_TEXT
 )
@@ -1,11 +1,22 @@
 # -*- coding: utf-8 -*-
-from typing import Any, Dict, List, Mapping, Union
+import functools
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    Tuple,
+    Union,
+)
 
 from kiara.api import KiaraModule, ValueMap, ValueMapSchema
 from kiara.exceptions import KiaraProcessingException
 from kiara_plugin.core_types.data_types.models import KiaraModelList
 from kiara_plugin.network_analysis.defaults import (
     ALLOWED_AGGREGATION_FUNCTIONS,
+    EDGES_TABLE_NAME,
     SOURCE_COLUMN_NAME,
     TARGET_COLUMN_NAME,
 )
@@ -22,6 +33,15 @@ KIARA_METADATA = {
 }
 
 
+# sql select column templates for the supported aggregation functions ('group_by' is handled separately)
+_AGGREGATION_SQL_TEMPLATES: Dict[str, str] = {
+    name: f"{name.upper()}({{source}}) as {{target}}"
+    for name in ALLOWED_AGGREGATION_FUNCTIONS.keys()
+    if name != "group_by"
+}
+_AGGREGATION_SQL_TEMPLATES["string_agg_comma"] = "STRING_AGG({source}, ',') as {target}"
+
+
 def generate_redefine_edges_doc():
     REDEFINE_EDGES_DOC = """Redefine edges by merging duplicate edges and applying aggregation functions to certain edge attributes.
 
@@ -41,11 +61,11 @@ If no target_column is specified, the original source column name is used. If no
 
 """
 
-    funcs_doc = ""
-    for name, doc in ALLOWED_AGGREGATION_FUNCTIONS.items():
-        funcs_doc = f"{funcs_doc}\n - ***{name}***: {doc}"
+    funcs_doc = "\n".join(
+        f" - ***{name}***: {doc}" for name, doc in ALLOWED_AGGREGATION_FUNCTIONS.items()
+    )
 
-    doc = f"{REDEFINE_EDGES_DOC}\n\n{funcs_doc}"
+    doc = f"{REDEFINE_EDGES_DOC}\n\n\n{funcs_doc}"
 
     EXAMPLES = """### Examples
 
@@ -96,6 +116,86 @@ inputs:
     return doc
 
 
+@functools.lru_cache(maxsize=128)
+def _build_redefine_edges_query(
+    strategies: Tuple[Tuple[str, str, Union[str, None]], ...],
+    column_names: FrozenSet[str],
+) -> str:
+    """Validate attribute map strategies against the available edge columns, and assemble the 'redefine_edges' query.
+
+    Strategies are provided as tuples of (target_column_name, source_column_name, transform_function), so the result
+    can be cached for repeated invocations with the same strategies and edges table columns.
+    """
+
+    targets: Tuple[str, ...] = ()
+    sources: Tuple[str, ...] = ()
+    funcs: Tuple[Union[str, None], ...] = ()
+    if strategies:
+
+        # unpack the strategy fields in a single pass
+        targets, sources, funcs = zip(*strategies)
+
+        source_column_names = frozenset(sources)
+
+        # if SOURCE_COLUMN_NAME in source_column_names:
+        #     raise KiaraProcessingException(
+        #         msg=f"Can't redefine edges with provided attribute map: the source column name '{SOURCE_COLUMN_NAME}' is reserved."
+        #     )
+
+        if TARGET_COLUMN_NAME in source_column_names:
+            raise KiaraProcessingException(
+                msg=f"Can't redefine edges with provided attribute map: the target column name '{TARGET_COLUMN_NAME}' is reserved."
+            )
+
+        for target_column_name in targets:
+            if target_column_name.startswith("_"):
+                raise KiaraProcessingException(
+                    msg=f"Can't redefine edges with provided column map: the target column name '{target_column_name}' starts with an underscore, which is reserved for automatically computed edge attributes."
+                )
+
+        invalid_columns = source_column_names.difference(column_names)
+        if invalid_columns:
+
+            msg = f"Can't redefine edges with provided attribute map strategies: the following columns are not available in the network data: {', '.join(invalid_columns)}"
+
+            msg = f"{msg}\n\nAvailable column names:\n\n"
+            for col_name in sorted(x for x in column_names if not x.startswith("_")):
+                msg = f"{msg}\n - {col_name}"
+            raise KiaraProcessingException(msg=msg)
+
+    sql_tokens: List[str] = []
+    group_bys = [SOURCE_COLUMN_NAME, TARGET_COLUMN_NAME]
+    for target_column_name, source_column_name, transform_function in zip(
+        targets, sources, funcs
+    ):
+
+        # if no transform function is specified, we use 'COUNT'
+        func_name = (transform_function or "count").lower()
+        if func_name == "group_by":
+            group_bys.append(source_column_name)
+            continue
+
+        sql_template = _AGGREGATION_SQL_TEMPLATES.get(func_name, None)
+        if sql_template is None:
+            raise KiaraProcessingException(
+                msg=f"Can't redefine edges with provided attribute map: invalid transform function '{func_name}'. Allowed: {', '.join(ALLOWED_AGGREGATION_FUNCTIONS.keys())}"
+            )
+        sql_tokens.append(
+            sql_template.format(source=source_column_name, target=target_column_name)
+        )
+
+    group_by_clause = ", ".join(group_bys)
+    query = "".join(
+        (
+            "SELECT ",
+            ", ".join(group_bys + sql_tokens),
+            f" FROM {EDGES_TABLE_NAME} GROUP BY ",
+            group_by_clause,
+        )
+    )
+    return query
+
+
 class RedefineNetworkEdgesModule(KiaraModule):
     """Redefine edges by merging duplicate edges and applying aggregation functions to certain edge attributes."""
 
@@ -109,10 +209,14 @@ class RedefineNetworkEdgesModule(KiaraModule):
         }
     }
 
+    _cached_doc: ClassVar[Union[str, None]] = None
+
     @classmethod
     def type_doc(cls):
 
-        return generate_redefine_edges_doc()
+        if cls._cached_doc is None:
+            cls._cached_doc = generate_redefine_edges_doc()
+        return cls._cached_doc
 
     def create_inputs_schema(
         self,
@@ -151,88 +255,36 @@ class RedefineNetworkEdgesModule(KiaraModule):
         network_data_obj = inputs.get_value_obj("network_data")
         network_data: NetworkData = network_data_obj.data
 
-        # needed for sql query later
-        edges_table = network_data.edges.arrow_table  # noqa
+        edges_table = network_data.edges.arrow_table
 
         attr_map_strategies: Union[
             None, KiaraModelList[AttributeMapStrategy]
         ] = inputs.get_value_data("attributes")
 
+        strategies: Tuple[Tuple[str, str, Union[str, None]], ...] = ()
         if attr_map_strategies:
+            strategies = tuple(
+                (
+                    strategy.target_column_name,
+                    strategy.source_column_name,
+                    strategy.transform_function,
+                )
+                for strategy in attr_map_strategies.list_items
+            )
+
+        # frozensets are hashable, so the column names can be part of the query cache key
+        query = _build_redefine_edges_query(
+            strategies=strategies,
+            column_names=network_data.edge_column_names,
+        )
 
-            invalid_columns = set()
-            for strategy in attr_map_strategies.list_items:
-
-                # if strategy.source_column_name == SOURCE_COLUMN_NAME:
-                #     raise KiaraProcessingException(
-                #         msg=f"Can't redefine edges with provided attribute map: the source column name '{SOURCE_COLUMN_NAME}' is reserved."
-                #     )
-
-                if strategy.source_column_name == TARGET_COLUMN_NAME:
-                    raise KiaraProcessingException(
-                        msg=f"Can't redefine edges with provided attribute map: the target column name '{TARGET_COLUMN_NAME}' is reserved."
-                    )
-
-                if strategy.target_column_name.startswith("_"):
-                    raise KiaraProcessingException(
-                        msg=f"Can't redefine edges with provided column map: the target column name '{strategy.target_column_name}' starts with an underscore, which is reserved for automatically computed edge attributes."
-                    )
-
-                if strategy.source_column_name not in network_data.edges.column_names:
-                    invalid_columns.add(strategy.source_column_name)
-
-            if invalid_columns:
-
-                msg = f"Can't redefine edges with provided attribute map strategies: the following columns are not available in the network data: {', '.join(invalid_columns)}"
-
-                msg = f"{msg}\n\nAvailable column names:\n\n"
-                for col_name in (
-                    x for x in network_data.edges.column_names if not x.startswith("_")
-                ):
-                    msg = f"{msg}\n - {col_name}"
-                raise KiaraProcessingException(msg=msg)
+        with duckdb.connect() as con:
+            con.register(EDGES_TABLE_NAME, edges_table)
+            new_edges = con.execute(query).arrow()
 
-        sql_tokens: List[str] = []
-        group_bys = [SOURCE_COLUMN_NAME, TARGET_COLUMN_NAME]
-        if attr_map_strategies:
-            for strategy in attr_map_strategies.list_items:
-
-                if not strategy.transform_function:
-                    # column_type = edges_table.field(strategy.source_column_name).type
-                    # if pa.types.is_integer(column_type) or pa.types.is_floating(
-                    #     column_type
-                    # ):
-                    #     transform_function = "SUM"
-                    # else:
-                    #     transform_function = "LIST"
-                    transform_function = "COUNT"
-                else:
-                    transform_function = strategy.transform_function
-
-                transform_function = transform_function.lower()
-                if transform_function == "group_by":
-                    group_bys.append(strategy.source_column_name)
-                    sql_token = None
-                elif transform_function == "string_agg_comma":
-                    sql_token = f"STRING_AGG({strategy.source_column_name}, ',') as {strategy.target_column_name}"
-                else:
-                    sql_token = f"{transform_function.upper()}({strategy.source_column_name}) as {strategy.target_column_name}"
-                if sql_token:
-                    sql_tokens.append(sql_token)
-
-        query = f"""
-        SELECT
-            {', '.join(group_bys)},
-            {', '.join(sql_tokens)}
-        FROM edges_table
-        GROUP BY {', '.join(group_bys)}
-        """
-
-        result = duckdb.sql(query)
-        new_edges_table = result.arrow()
         network_data = NetworkData.create_network_data(
             nodes_table=network_data.nodes.arrow_table,
-            edges_table=new_edges_table,
+            edges_table=new_edges,
             augment_tables=True,
         )
         outputs.set_values(network_data=network_data)
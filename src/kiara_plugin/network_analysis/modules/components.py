@@ -1,17 +1,24 @@
 # -*- coding: utf-8 -*-
-from typing import TYPE_CHECKING, Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, List
 
 from kiara.api import KiaraModule, ValueMap, ValueMapSchema
-from kiara.exceptions import KiaraException
 from kiara_plugin.network_analysis.defaults import (
     ATTRIBUTE_PROPERTY_KEY,
     COMPONENT_ID_COLUMN_NAME,
     IS_CUTPOINT_COLUMN_NAME,
+    NODE_ID_COLUMN_NAME,
+    SOURCE_COLUMN_NAME,
+    TARGET_COLUMN_NAME,
 )
 from kiara_plugin.network_analysis.models import NetworkData
-from kiara_plugin.network_analysis.models.metadata import NetworkNodeAttributeMetadata
+from kiara_plugin.network_analysis.models.metadata import (
+    NetworkNodeAttributeMetadata,
+    create_attribute_metadata,
+)
 
 if TYPE_CHECKING:
+    import rustworkx as rx
+
     from kiara.models import KiaraModel
 
 KIARA_METADATA = {
@@ -26,10 +33,40 @@ KIARA_METADATA = {
 COMPONENT_COLUMN_TEXT = """The id of the component the node is part of.
 
 If all nodes are connected, all nodes will have '0' as value in the component_id field. Otherwise, the nodes will be assigned 'component_id'-s according to the component they belong to, with the largest component having '0' as component_id, the second largest '1' and so on. If two components have the same size, who gets the higher component_id is not determinate."""
-COMPONENT_COLUMN_METADATA = NetworkNodeAttributeMetadata(doc=COMPONENT_COLUMN_TEXT, computed_attribute=True)  # type: ignore
+COMPONENT_COLUMN_METADATA = create_attribute_metadata(
+    NetworkNodeAttributeMetadata, COMPONENT_COLUMN_TEXT
+)
 
 CUT_POINTS_TEXT = """Whether the node is a cut point or not."""
-CUT_POINTS_COLUMN_METADATA = NetworkNodeAttributeMetadata(doc=COMPONENT_COLUMN_TEXT, computed_attribute=True)  # type: ignore
+CUT_POINTS_COLUMN_METADATA = create_attribute_metadata(
+    NetworkNodeAttributeMetadata, CUT_POINTS_TEXT
+)
+
+
+def create_structure_graph(network_data: NetworkData) -> "rx.PyGraph":
+    """Create an undirected rustworkx graph that only contains the structure of the network data.
+
+    Nodes have no payload, and the index of each graph node is the row index of the node in the nodes table.
+    """
+
+    import rustworkx as rx
+
+    nodes = network_data.nodes.arrow_table
+    node_ids: List[int] = nodes.column(NODE_ID_COLUMN_NAME).to_pylist()
+    edges = network_data.edges.arrow_table
+    sources: List[int] = edges.column(SOURCE_COLUMN_NAME).to_pylist()
+    targets: List[int] = edges.column(TARGET_COLUMN_NAME).to_pylist()
+
+    # in most cases, the node ids are equal to the row indexes, and we don't need to translate them
+    if node_ids != list(range(len(node_ids))):
+        node_indexes = {node_id: idx for idx, node_id in enumerate(node_ids)}
+        sources = [node_indexes[x] for x in sources]
+        targets = [node_indexes[x] for x in targets]
+
+    graph = rx.PyGraph(multigraph=False)
+    graph.add_nodes_from([None] * len(node_ids))
+    graph.add_edges_from_no_data(list(zip(sources, targets)))
+    return graph
 
 
 class CalculateComponentModule(KiaraModule):
@@ -81,62 +118,39 @@ class CalculateComponentModule(KiaraModule):
         network_value = inputs.get_value_obj("network_data")
         network_data: NetworkData = network_value.data
 
-        # TODO: maybe this can be done directly in sql, without networx, which would be faster and better
-        # for memory usage
-        undir_graph = network_data.as_rustworkx_graph(
-            graph_type=rx.PyGraph,
-            multigraph=False,
-            omit_self_loops=False,
-            attach_node_id_map=True,
-        )
-        undir_components = rx.connected_components(undir_graph)  # type: ignore
-
         nodes_columns_metadata: Dict[str, Dict[str, KiaraModel]] = {
             COMPONENT_ID_COLUMN_NAME: {
                 ATTRIBUTE_PROPERTY_KEY: COMPONENT_COLUMN_METADATA
             }
         }
 
-        if len(undir_components) == 1:
-
-            nodes = network_data.nodes.arrow_table
-            components_column = pa.array([0] * len(nodes), type=pa.int64())
-            nodes = nodes.append_column(COMPONENT_ID_COLUMN_NAME, components_column)
-
-            network_data = NetworkData.create_network_data(
-                nodes_table=nodes,
-                edges_table=network_data.edges.arrow_table,
-                augment_tables=False,
-                nodes_column_metadata=nodes_columns_metadata,
-            )
-            outputs.set_values(
-                network_data=network_data,
-                number_of_components=1,
-                is_connected=True,
-            )
-            return
-
-        number_of_components = len(undir_components)
-        is_connected = False
-        node_id_map = undir_graph.attrs["node_id_map"]  # type: ignore
-
-        node_components = {}
-        for idx, component in enumerate(
-            sorted(undir_components, key=len, reverse=True)
-        ):
-            for node in component:
-                node_id = node_id_map[node]
-                node_components[node_id] = idx
-
-        if len(node_components) != network_data.num_nodes:
-            raise KiaraException(
-                "Number of nodes in component map does not match number of nodes in network data. This is most likely a bug."
-            )
-
-        components_column = pa.array(
-            (node_components[node_id] for node_id in sorted(node_components.keys())),
-            type=pa.int64(),
-        )
+        if network_data.num_edges == 0 or network_data.num_nodes <= 1:
+            # without edges (or with a single node, which can at most have self-loops), every node is its own
+            # component, so we don't need to build a graph (all components have the same size, so the order of the
+            # component ids is arbitrary)
+            number_of_components = network_data.num_nodes
+            components_column = pa.array(range(number_of_components), type=pa.int64())
+        else:
+            # components only depend on the graph structure, so we don't need any node payloads
+            undir_graph = create_structure_graph(network_data)
+            undir_components = rx.connected_components(undir_graph)  # type: ignore
+            number_of_components = len(undir_components)
+
+            if number_of_components == 1:
+                # created natively, without going through a Python list
+                components_column = pa.repeat(
+                    pa.scalar(0, type=pa.int64()), network_data.num_nodes
+                )
+            else:
+                # the graph node indexes follow the row order of the nodes table, so we can fill the column by index
+                component_ids = [0] * network_data.num_nodes
+                for idx, component in enumerate(
+                    sorted(undir_components, key=len, reverse=True)
+                ):
+                    for node in component:
+                        component_ids[node] = idx
+
+                components_column = pa.array(component_ids, type=pa.int64())
 
         nodes = network_data.nodes.arrow_table
         nodes = nodes.append_column(COMPONENT_ID_COLUMN_NAME, components_column)
@@ -147,7 +161,7 @@ class CalculateComponentModule(KiaraModule):
             nodes_column_metadata=nodes_columns_metadata,
         )
         outputs.set_values(
-            is_connected=is_connected,
+            is_connected=number_of_components == 1,
             number_of_components=number_of_components,
             network_data=network_data,
         )
@@ -186,25 +200,13 @@ class CutPointsList(KiaraModule):
         network_value = inputs.get_value_obj("network_data")
         network_data: NetworkData = network_value.data
 
-        # TODO: maybe this can be done directly in sql, without networx, which would be faster and better
-        # for memory usage
-        undir_graph = network_data.as_rustworkx_graph(
-            graph_type=rx.PyGraph,
-            multigraph=False,
-            omit_self_loops=False,
-            attach_node_id_map=True,
-        )
-
-        node_id_map = undir_graph.attrs["node_id_map"]  # type: ignore
+        # the graph node indexes are the row indexes of the nodes table, so we don't need a node id map
+        undir_graph = create_structure_graph(network_data)
 
-        cut_points = rx.articulation_points(undir_graph)  # type: ignore
-        translated_cut_points = [node_id_map[x] for x in cut_points]
-        if not cut_points:
-            raise NotImplementedError()
-        cut_points_column = [
-            x in translated_cut_points
-            for x in range(0, network_data.num_nodes)  # noqa: PIE808
-        ]
+        # if there are no cut points, the column just contains 'False' for every node
+        cut_points_column = [False] * network_data.num_nodes
+        for node in rx.articulation_points(undir_graph):  # type: ignore
+            cut_points_column[node] = True
 
         nodes = network_data.nodes.arrow_table
         nodes = nodes.append_column(
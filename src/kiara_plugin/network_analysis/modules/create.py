@@ -1,5 +1,17 @@
 # -*- coding: utf-8 -*-
-from typing import Any, Dict, List, Mapping, Union
+import functools
+import os
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Tuple,
+    Union,
+)
 
 from pydantic import Field
 
@@ -28,6 +40,12 @@ from kiara_plugin.network_analysis.defaults import (
 from kiara_plugin.network_analysis.models import NetworkData
 from kiara_plugin.tabular.models.table import KiaraTable
 
+if TYPE_CHECKING:
+    import polars as pl
+
+# temporary column name for the original node ids in the node id map
+OLD_NODE_ID_COLUMN_NAME = "__old_node_id"
+
 KIARA_METADATA = {
     "authors": [
         {"name": "Lena Jaskov", "email": "helena.jaskov@uni.lu"},
@@ -37,6 +55,79 @@ KIARA_METADATA = {
 }
 
 
+# maps supported file extensions to: the name of the networkx reader function, keyword arguments for that reader,
+# the name of the attribute kiara should use to populate the node labels, and the node attributes to ignore when
+# creating the node table (mostly useful if we know that the file contains attributes that are not relevant for the
+# network, or for 'label', if we don't want to duplicate the information in '_label' and 'label')
+_NETWORK_FILE_READERS: Dict[
+    str, Tuple[str, Mapping[str, Any], Union[str, None], Union[Tuple[str, ...], None]]
+] = {
+    # we use 'lable="id"' here because networkx is fussy about labels being unique and non-null
+    # we use the 'label' attribute for the node labels manually later
+    ".gml": ("read_gml", {"label": "id"}, "label", ("label",)),
+    ".gexf": ("read_gexf", {}, None, None),
+    ".graphml": ("read_graphml", {}, None, None),
+    ".pajek": ("read_pajek", {}, None, None),
+    ".net": ("read_pajek", {}, None, None),
+    ".leda": ("read_leda", {}, None, None),
+    ".graph6": ("read_graph6", {}, None, None),
+    ".g6": ("read_graph6", {}, None, None),
+    ".sparse6": ("read_sparse6", {}, None, None),
+    ".s6": ("read_sparse6", {}, None, None),
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _column_alias_set(aliases: Tuple[str, ...]) -> FrozenSet[str]:
+    return frozenset(x.lower() for x in aliases)
+
+
+def find_column_by_alias(
+    column_names: Iterable[str], aliases: Iterable[str]
+) -> Union[str, None]:
+    """Return the first column name that matches (case-insensitive) one of the provided aliases, or 'None'."""
+
+    alias_set = _column_alias_set(tuple(aliases))
+    return next((x for x in column_names if x.lower() in alias_set), None)
+
+
+def add_column_mapping(
+    column_map: Mapping[str, str],
+    column_name: str,
+    mapped_column_name: str,
+    column_type: str,
+    column_map_input_name: str,
+) -> Dict[str, str]:
+    """Return a copy of the column map that maps the column to the (internal) mapped column name.
+
+    Raises an exception if the column map already contains a different mapping for the column. The provided
+    column map is not modified, since it is (potentially shared) input data.
+    """
+
+    existing_mapping = column_map.get(column_name, None)
+    if existing_mapping is not None and existing_mapping != mapped_column_name:
+        raise KiaraProcessingException(
+            f"Existing mapping of {column_type} column name '{column_name}' is not mapped to '{mapped_column_name}' in the '{column_map_input_name}' input."
+        )
+    return {**column_map, column_name: mapped_column_name}
+
+
+def map_node_ids(node_ids: "pl.Series", node_id_map: "pl.DataFrame") -> "pl.Series":
+    """Translate the (original) node ids in a series to the new node ids, using the provided node id map.
+
+    The node id map needs to have two columns: the original node ids (in the 'OLD_NODE_ID_COLUMN_NAME' column), and
+    the new ones (in the 'NODE_ID_COLUMN_NAME' column). The node ids are cast to the type of the original node ids
+    before they are joined, and the result has the same length and order as the input, with nulls for unmapped ids.
+    """
+
+    old_node_id_type = node_id_map.schema[OLD_NODE_ID_COLUMN_NAME]
+    keys = node_ids.cast(old_node_id_type).to_frame(OLD_NODE_ID_COLUMN_NAME)
+
+    # a left join preserves the order of the left dataframe
+    mapped = keys.join(node_id_map, on=OLD_NODE_ID_COLUMN_NAME, how="left")
+    return mapped.get_column(NODE_ID_COLUMN_NAME)
+
+
 class CreateNetworkDataModuleConfig(CreateFromModuleConfig):
     ignore_errors: bool = Field(
         description="Whether to ignore convert errors and omit the failed items.",
@@ -62,73 +153,27 @@ class CreateNetworkDataModule(CreateFromModule):
         """
 
         source_file: KiaraFile = source_value.data
-        # the name of the attribute kiara should use to populate the node labels
-        label_attr_name: Union[str, None] = None
-        # attributes to ignore when creating the node table,
-        # mostly useful if we know that the file contains attributes that are not relevant for the network
-        # or for 'label', if we don't want to duplicate the information in '_label' and 'label'
-        ignore_node_attributes = None
-
-        if source_file.file_name.endswith(".gml"):
-            import networkx as nx
-
-            # we use 'lable="id"' here because networkx is fussy about labels being unique and non-null
-            # we use the 'label' attribute for the node labels manually later
-            graph = nx.read_gml(source_file.path, label="id")
-            label_attr_name = "label"
-            ignore_node_attributes = ["label"]
-
-        elif source_file.file_name.endswith(".gexf"):
-            import networkx as nx
-
-            graph = nx.read_gexf(source_file.path)
-        elif source_file.file_name.endswith(".graphml"):
-            import networkx as nx
-
-            graph = nx.read_graphml(source_file.path)
-        elif source_file.file_name.endswith(".pajek") or source_file.file_name.endswith(
-            ".net"
-        ):
-            import networkx as nx
-
-            graph = nx.read_pajek(source_file.path)
-        elif source_file.file_name.endswith(".leda"):
-            import networkx as nx
-
-            graph = nx.read_leda(source_file.path)
-        elif source_file.file_name.endswith(
-            ".graph6"
-        ) or source_file.file_name.endswith(".g6"):
-            import networkx as nx
-
-            graph = nx.read_graph6(source_file.path)
-        elif source_file.file_name.endswith(
-            ".sparse6"
-        ) or source_file.file_name.endswith(".s6"):
-            import networkx as nx
-
-            graph = nx.read_sparse6(source_file.path)
-        else:
-            supported_file_estensions = [
-                "gml",
-                "gexf",
-                "graphml",
-                "pajek",
-                "leda",
-                "graph6",
-                "g6",
-                "sparse6",
-                "s6",
-            ]
+
+        _, extension = os.path.splitext(source_file.file_name)
+        reader = _NETWORK_FILE_READERS.get(extension, None)
+        if reader is None:
+            supported_file_estensions = [x[1:] for x in _NETWORK_FILE_READERS.keys()]
 
             msg = f"Can't create network data for unsupported format of file: {source_file.file_name}. Supported file extensions: {', '.join(supported_file_estensions)}"
 
             raise KiaraProcessingException(msg)
 
+        import networkx as nx
+
+        reader_name, reader_kwargs, label_attr_name, ignore_node_attributes = reader
+        graph = getattr(nx, reader_name)(source_file.path, **reader_kwargs)
+
         return NetworkData.create_from_networkx_graph(
             graph=graph,
             label_attr_name=label_attr_name,
-            ignore_node_attributes=ignore_node_attributes,
+            ignore_node_attributes=(
+                list(ignore_node_attributes) if ignore_node_attributes else None
+            ),
         )
 
 
@@ -222,11 +267,17 @@ class AssembleGraphFromTablesModule(KiaraModule):
 
         import polars as pl
 
+        # the column name aliases used for auto-detection, looked up once up front
+        node_id_column_aliases = self.get_config_value("node_id_column_aliases")
+        label_column_aliases = self.get_config_value("label_column_aliases")
+        source_column_aliases = self.get_config_value("source_column_aliases")
+        target_column_aliases = self.get_config_value("target_column_aliases")
+
         # process nodes
         nodes = inputs.get_value_obj("nodes")
 
         # the nodes column map can be used to rename attribute columns in the nodes table
-        nodes_column_map: Dict[str, str] = inputs.get_value_data("nodes_column_map")
+        nodes_column_map: Mapping[str, str] = inputs.get_value_data("nodes_column_map")
         if nodes_column_map is None:
             nodes_column_map = {}
 
@@ -247,11 +298,9 @@ class AssembleGraphFromTablesModule(KiaraModule):
 
             if id_column_name is None:
                 # try to auto-detect the id column
-                column_names_to_test = self.get_config_value("node_id_column_aliases")
-                for col_name in nodes_column_names:
-                    if col_name.lower() in column_names_to_test:
-                        id_column_name = col_name
-                        break
+                id_column_name = find_column_by_alias(
+                    nodes_column_names, node_id_column_aliases
+                )
 
                 job_log.add_log(f"auto-detected id column: {id_column_name}")
                 if id_column_name is None:
@@ -264,27 +313,23 @@ class AssembleGraphFromTablesModule(KiaraModule):
                     f"Could not find id column '{id_column_name}' in the nodes table. Please specify a valid column name manually, using one of: {', '.join(nodes_column_names)}"
                 )
 
-            nodes_column_map[id_column_name] = NODE_ID_COLUMN_NAME
-            if id_column_name in nodes_column_map.keys():
-                if nodes_column_map[id_column_name] != NODE_ID_COLUMN_NAME:
-                    raise KiaraProcessingException(
-                        f"Existing mapping of id column name '{id_column_name}' is not mapped to '{NODE_ID_COLUMN_NAME}' in the 'nodes_column_map' input."
-                    )
-            else:
-                nodes_column_map[id_column_name] = NODE_ID_COLUMN_NAME
+            nodes_column_map = add_column_mapping(
+                nodes_column_map,
+                id_column_name,
+                NODE_ID_COLUMN_NAME,
+                "id",
+                "nodes_column_map",
+            )
 
             # the label is optional, if not specified, we try to auto-detect it. If not possible, we will use the (stringified) id column as label.
             label_column_name = inputs.get_value_data("label_column")
             if label_column_name is None:
                 job_log.add_log("auto-detecting label column")
-                column_names_to_test = self.get_config_value("label_column_aliases")
-                for col_name in nodes_column_names:
-                    if col_name.lower() in column_names_to_test:
-                        label_column_name = col_name
-                        job_log.add_log(
-                            f"auto-detected label column: {label_column_name}"
-                        )
-                        break
+                label_column_name = find_column_by_alias(
+                    nodes_column_names, label_column_aliases
+                )
+                if label_column_name is not None:
+                    job_log.add_log(f"auto-detected label column: {label_column_name}")
 
             if label_column_name and label_column_name not in nodes_column_names:
                 raise KiaraProcessingException(
@@ -310,25 +355,23 @@ class AssembleGraphFromTablesModule(KiaraModule):
 
         if edges_source_column_name is None:
             job_log.add_log("auto-detecting source column")
-            column_names_to_test = self.get_config_value("source_column_aliases")
-            for item in edges_column_names:
-                if item.lower() in column_names_to_test:
-                    edges_source_column_name = item
-                    job_log.add_log(
-                        f"auto-detected source column: {edges_source_column_name}"
-                    )
-                    break
+            edges_source_column_name = find_column_by_alias(
+                edges_column_names, source_column_aliases
+            )
+            if edges_source_column_name is not None:
+                job_log.add_log(
+                    f"auto-detected source column: {edges_source_column_name}"
+                )
 
         if edges_target_column_name is None:
             job_log.add_log("auto-detecting target column")
-            column_names_to_test = self.get_config_value("target_column_aliases")
-            for item in edges_column_names:
-                if item.lower() in column_names_to_test:
-                    edges_target_column_name = item
-                    job_log.add_log(
-                        f"auto-detected target column: {edges_target_column_name}"
-                    )
-                    break
+            edges_target_column_name = find_column_by_alias(
+                edges_column_names, target_column_aliases
+            )
+            if edges_target_column_name is not None:
+                job_log.add_log(
+                    f"auto-detected target column: {edges_target_column_name}"
+                )
 
         if not edges_source_column_name or not edges_target_column_name:
             if not edges_source_column_name and not edges_target_column_name:
@@ -353,29 +396,28 @@ class AssembleGraphFromTablesModule(KiaraModule):
                     f"Could not auto-detect target column name. Please specify it manually using one of: {', '.join(edges_column_names)}."
                 )
 
-        edges_column_map: Dict[str, str] = inputs.get_value_data("edges_column_map")
+        edges_column_map: Mapping[str, str] = inputs.get_value_data("edges_column_map")
         if edges_column_map is None:
             edges_column_map = {}
 
-        if edges_source_column_name in edges_column_map.keys():
-            if edges_column_map[edges_source_column_name] != SOURCE_COLUMN_NAME:
-                raise KiaraProcessingException(
-                    f"Existing mapping of source column name '{edges_source_column_name}' is not mapped to '{SOURCE_COLUMN_NAME}' in the 'edges_column_map' input."
-                )
-        else:
-            edges_column_map[edges_source_column_name] = SOURCE_COLUMN_NAME
-
-        if edges_target_column_name in edges_column_map.keys():
-            if edges_column_map[edges_target_column_name] == SOURCE_COLUMN_NAME:
-                raise KiaraProcessingException(
-                    msg="Edges and source column names can't be the same."
-                )
-            if edges_column_map[edges_target_column_name] != TARGET_COLUMN_NAME:
-                raise KiaraProcessingException(
-                    f"Existing mapping of target column name '{edges_target_column_name}' is not mapped to '{TARGET_COLUMN_NAME}' in the 'edges_column_map' input."
-                )
-        else:
-            edges_column_map[edges_target_column_name] = TARGET_COLUMN_NAME
+        edges_column_map = add_column_mapping(
+            edges_column_map,
+            edges_source_column_name,
+            SOURCE_COLUMN_NAME,
+            "source",
+            "edges_column_map",
+        )
+        if edges_column_map.get(edges_target_column_name, None) == SOURCE_COLUMN_NAME:
+            raise KiaraProcessingException(
+                msg="Edges and source column names can't be the same."
+            )
+        edges_column_map = add_column_mapping(
+            edges_column_map,
+            edges_target_column_name,
+            TARGET_COLUMN_NAME,
+            "target",
+            "edges_column_map",
+        )
 
         if edges_source_column_name not in edges_column_names:
             raise KiaraProcessingException(
@@ -391,26 +433,29 @@ class AssembleGraphFromTablesModule(KiaraModule):
 
         job_log.add_log("generating node id map and nodes table")
         # fill out the node id map
+        # we rechunk, so 'unique' can work on a single contiguous buffer
         unique_node_ids_old = (
-            pl.concat([source_column_old, target_column_old], rechunk=False)
+            pl.concat([source_column_old, target_column_old], rechunk=True)
             .unique()
             .sort()
         )
 
+        # the node id map is a two-column dataframe (old id -> new id), which is joined onto the edges table later
         if nodes_arrow_dataframe is None:
-            new_node_ids = range(0, len(unique_node_ids_old))  # noqa: PIE808
-            node_id_map = dict(zip(unique_node_ids_old, new_node_ids))
-            # node_id_map = {
-            #     node_id: new_node_id
-            #     for node_id, new_node_id in
-            # }
-
-            nodes_arrow_dataframe = pl.DataFrame(
-                {
-                    NODE_ID_COLUMN_NAME: new_node_ids,
-                    LABEL_COLUMN_NAME: (str(x) for x in unique_node_ids_old),
-                    "id": unique_node_ids_old,
-                }
+            # the node ids and (stringified) labels are computed natively, in a single pass
+            nodes_arrow_dataframe = (
+                unique_node_ids_old.to_frame("id")
+                .with_row_count(NODE_ID_COLUMN_NAME)
+                .select(
+                    [
+                        pl.col(NODE_ID_COLUMN_NAME).cast(pl.Int64),
+                        pl.col("id").cast(pl.Utf8).alias(LABEL_COLUMN_NAME),
+                        pl.col("id"),
+                    ]
+                )
+            )
+            node_id_map = nodes_arrow_dataframe.select(
+                [pl.col("id").alias(OLD_NODE_ID_COLUMN_NAME), NODE_ID_COLUMN_NAME]
             )
 
         else:
@@ -418,74 +463,88 @@ class AssembleGraphFromTablesModule(KiaraModule):
             unique_node_ids_nodes_table = id_column_old.unique().sort()
 
             if len(unique_node_ids_old) > len(unique_node_ids_nodes_table):
-                ~(unique_node_ids_old.is_in(unique_node_ids_nodes_table))
                 raise NotImplementedError("MISSING NODE IDS NOT IMPLEMENTED YET")
             else:
-                new_node_ids = range(0, len(id_column_old))  # noqa: PIE808
-                node_id_map = dict(zip(id_column_old, new_node_ids))
-                # node_id_map = {
-                #     node_id: new_node_id
-                #     for node_id, new_node_id in
-                # }
+                # polars creates the id series natively from the range, and it is shared by the id map and nodes table
                 new_idx_series = pl.Series(
-                    name=NODE_ID_COLUMN_NAME, values=new_node_ids
+                    name=NODE_ID_COLUMN_NAME,
+                    values=range(0, len(id_column_old)),  # noqa: PIE808
+                    dtype=pl.Int64,
                 )
-                nodes_arrow_dataframe.insert_at_idx(0, new_idx_series)
-
-                if not label_column_name:
-                    label_column_name = NODE_ID_COLUMN_NAME
+                node_id_map = pl.DataFrame(
+                    [id_column_old.alias(OLD_NODE_ID_COLUMN_NAME), new_idx_series]
+                )
+                if len(unique_node_ids_nodes_table) != len(id_column_old):
+                    # duplicate ids would multiply edges in the join, the last occurrence wins (as it always did)
+                    node_id_map = node_id_map.unique(
+                        subset=OLD_NODE_ID_COLUMN_NAME, keep="last"
+                    )
 
                 # we create a copy of the label column, and stringify its items
 
-                label_column = nodes_arrow_dataframe.get_column(
-                    label_column_name
-                ).rename(LABEL_COLUMN_NAME)
-                if label_column.dtype != pl.Utf8:
-                    label_column = label_column.cast(pl.Utf8)
-
+                if not label_column_name:
+                    label_column_name = NODE_ID_COLUMN_NAME
+                    label_column = new_idx_series
+                else:
+                    label_column = nodes_arrow_dataframe.get_column(label_column_name)
+                # the null count is stored with the column data, and a cast doesn't add nulls, so we check before casting
                 if label_column.null_count() != 0:
                     raise KiaraProcessingException(
                         f"Label column '{label_column_name}' contains null values. This is not allowed."
                     )
 
-                nodes_arrow_dataframe = nodes_arrow_dataframe.insert_at_idx(
-                    1, label_column
+                label_column = label_column.rename(LABEL_COLUMN_NAME)
+                if label_column.dtype != pl.Utf8:
+                    label_column = label_column.cast(pl.Utf8)
+
+                # prepend the id and label columns in one go, instead of inserting them one after the other
+                nodes_arrow_dataframe = pl.DataFrame(
+                    [new_idx_series, label_column]
+                ).hstack(nodes_arrow_dataframe)
+
+        # the original source/target columns are dropped, so the other columns must not clash with the new ones
+        other_edges_column_names = [
+            x
+            for x in edges_column_names
+            if x not in (edges_source_column_name, edges_target_column_name)
+        ]
+        for column_name in (SOURCE_COLUMN_NAME, TARGET_COLUMN_NAME):
+            if column_name in other_edges_column_names:
+                raise KiaraProcessingException(
+                    f"Edges table contains a column named '{column_name}' that is not used as source or target column. This column name is reserved, please rename or remove it."
                 )
 
-        # TODO: deal with different types if node ids are strings or integers
         try:
-            source_column_mapped = source_column_old.map_dict(
-                node_id_map, default=None
-            ).rename(SOURCE_COLUMN_NAME)
+            source_column = map_node_ids(source_column_old, node_id_map)
         except Exception:
             raise KiaraProcessingException(
                 "Could not map node ids onto edges source column.  In most cases the issue is that your node ids have a different data type in your nodes table as in the source column of your edges table."
             )
 
-        if source_column_mapped.is_null().any():
+        if source_column.null_count() != 0:
             raise KiaraProcessingException(
                 "The source column contains values that are not mapped in the nodes table."
             )
 
         try:
-            target_column_mapped = target_column_old.map_dict(
-                node_id_map, default=None
-            ).rename(TARGET_COLUMN_NAME)
+            target_column = map_node_ids(target_column_old, node_id_map)
         except Exception:
             raise KiaraProcessingException(
                 "Could not map node ids onto edges source column.  In most cases the issue is that your node ids have a different data type in your nodes table as in the target column of your edges table."
             )
 
-        if target_column_mapped.is_null().any():
+        if target_column.null_count() != 0:
             raise KiaraProcessingException(
                 "The target column contains values that are not mapped in the nodes table."
             )
 
-        edges_arrow_dataframe.insert_at_idx(0, source_column_mapped)
-        edges_arrow_dataframe.insert_at_idx(1, target_column_mapped)
-
-        edges_arrow_dataframe = edges_arrow_dataframe.drop(edges_source_column_name)
-        edges_arrow_dataframe = edges_arrow_dataframe.drop(edges_target_column_name)
+        # put the mapped columns at the front, in place of the original ones
+        edges_arrow_dataframe = pl.DataFrame(
+            [
+                source_column.alias(SOURCE_COLUMN_NAME),
+                target_column.alias(TARGET_COLUMN_NAME),
+            ]
+        ).hstack(edges_arrow_dataframe.select(other_edges_column_names).get_columns())
 
         edges_arrow_table = edges_arrow_dataframe.to_arrow()
         # edges_table_augmented = augment_edges_table_with_weights(edges_arrow_dataframe)
@@ -1,15 +1,104 @@
 # -*- coding: utf-8 -*-
 import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, List, Tuple
 
 from kiara.modules.included_core_modules.export_as import DataExportModule
 from kiara_plugin.network_analysis.models import NetworkData
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from kiara_plugin.tabular.models.table import KiaraTable
+
 KIARA_METADATA = {
     "authors": [{"name": "Markus Binsteiner", "email": "markus@frkl.io"}],
     "description": "Modules related to extracting components from network data.",
 }
 
 
+def write_tables(
+    value: NetworkData,
+    base_path: str,
+    name: str,
+    extension: str,
+    write_table: Callable[["pa.Table", str], Any],
+) -> List[str]:
+    """Write every table of the network data into its own '<name>__<table_name>.<extension>' file.
+
+    The tables are independent, and the Arrow writers release the GIL, so they are written in parallel threads.
+    """
+
+    def write(item: Tuple[str, "KiaraTable"]) -> str:
+        table_name, table = item
+        target_path = os.path.join(base_path, f"{name}__{table_name}.{extension}")
+        write_table(table.arrow_table, target_path)
+        return target_path
+
+    tables = list(value.tables.items())
+    with ThreadPoolExecutor(max_workers=max(len(tables), 1)) as executor:
+        return list(executor.map(write, tables))
+
+
+def stringify_nested_columns(table: "pa.Table") -> "pa.Table":
+    """Replace all nested (list, struct, map) columns of a table with their json string representation."""
+
+    import pyarrow as pa
+
+    for idx, field in enumerate(table.schema):
+        if not pa.types.is_nested(field.type):
+            continue
+        table = table.set_column(idx, field.name, json_encode_column(table.column(idx)))
+    return table
+
+
+def json_encode_column(column: "pa.ChunkedArray") -> "pa.ChunkedArray":
+    """Encode the values of a column as json strings, null values stay null.
+
+    The encoding is done natively by duckdb, only types duckdb can't read from Arrow are encoded in Python.
+    """
+
+    import duckdb
+    import pyarrow as pa
+
+    try:
+        with duckdb.connect() as con:
+            con.register("json_column", pa.table({"value": column}))
+            return (
+                con.execute("SELECT to_json(value)::VARCHAR AS value FROM json_column")
+                .arrow()
+                .column("value")
+            )
+    except duckdb.Error:
+        import json
+
+        values = [
+            None if x is None else json.dumps(x, default=str)
+            for x in column.to_pylist()
+        ]
+        return pa.chunked_array([pa.array(values, type=pa.string())])
+
+
+def write_csv_table(table: "pa.Table", target_path: str) -> None:
+    """Write a table as csv file, nested values (which csv can't represent) are written as json strings."""
+
+    from pyarrow import csv
+
+    # the csv writer runs natively, directly on the Arrow data, larger batches mean fewer write calls
+    write_options = csv.WriteOptions(include_header=True, batch_size=65536)
+    csv.write_csv(
+        stringify_nested_columns(table), target_path, write_options=write_options
+    )
+
+
+def write_parquet_table(table: "pa.Table", target_path: str) -> None:
+    """Write a table as (zstd compressed) parquet file."""
+
+    import pyarrow.parquet as pq
+
+    pq.write_table(table, target_path, compression="zstd")
+
+
 class ExportNetworkDataModule(DataExportModule):
     """Export network data items."""
 
@@ -28,7 +117,9 @@ class ExportNetworkDataModule(DataExportModule):
         graph: nx.Graph = value.as_networkx_graph(
             nx.DiGraph, incl_node_attributes=True, incl_edge_attributes=True
         )
-        nx.write_graphml(graph, target_path)
+        # 'write_graphml' uses lxml if it is available, indenting the output only slows
+        # down serializing large graphs
+        nx.write_graphml(graph, target_path, prettyprint=False)
 
         return {"files": target_path}
 
@@ -116,3 +207,31 @@ class ExportNetworkDataModule(DataExportModule):
         nx.write_network_text(graph, target_path)
 
         return {"files": target_path}
+
+    def export__network_data__as__csv_files(
+        self, value: NetworkData, base_path: str, name: str
+    ):
+        """Export network data as 2 csv files (one for the nodes, one for the edges)."""
+
+        files = write_tables(
+            value,
+            base_path=base_path,
+            name=name,
+            extension="csv",
+            write_table=write_csv_table,
+        )
+        return {"files": files}
+
+    def export__network_data__as__parquet_files(
+        self, value: NetworkData, base_path: str, name: str
+    ):
+        """Export network data as 2 parquet files (one for the nodes, one for the edges)."""
+
+        files = write_tables(
+            value,
+            base_path=base_path,
+            name=name,
+            extension="parquet",
+            write_table=write_parquet_table,
+        )
+        return {"files": files}
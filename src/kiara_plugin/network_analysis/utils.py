@@ -138,10 +138,10 @@ def extract_networkx_edges_as_table(
     }
 
     for source, target, edge_data in graph.edges(data=True):
-        if source not in node_id_map.keys():
+        if source not in node_id_map:
             max_node_id += 1
             node_id_map[source] = max_node_id
-        if target not in node_id_map.keys():
+        if target not in node_id_map:
             max_node_id += 1
             node_id_map[target] = max_node_id
 
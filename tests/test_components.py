@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+from typing import Dict, List, Tuple
+
+import pyarrow as pa
+import pytest  # noqa
+
+from kiara.interfaces.python_api import KiaraAPI
+from kiara_plugin.network_analysis.defaults import (
+    COMPONENT_ID_COLUMN_NAME,
+    IS_CUTPOINT_COLUMN_NAME,
+    LABEL_COLUMN_NAME,
+    NODE_ID_COLUMN_NAME,
+    SOURCE_COLUMN_NAME,
+    TARGET_COLUMN_NAME,
+)
+from kiara_plugin.network_analysis.models import NetworkData
+
+
+def create_network_data(edges: List[Tuple[int, int]], num_nodes: int) -> NetworkData:
+
+    nodes = pa.table(
+        {
+            NODE_ID_COLUMN_NAME: list(range(num_nodes)),
+            LABEL_COLUMN_NAME: [str(x) for x in range(num_nodes)],
+        }
+    )
+    edges_table = pa.table(
+        {
+            SOURCE_COLUMN_NAME: pa.array([x[0] for x in edges], type=pa.int64()),
+            TARGET_COLUMN_NAME: pa.array([x[1] for x in edges], type=pa.int64()),
+        }
+    )
+    return NetworkData.create_network_data(nodes_table=nodes, edges_table=edges_table)
+
+
+def extract_cut_points(
+    kiara_api: KiaraAPI, network_data: NetworkData
+) -> Dict[int, bool]:
+
+    results = kiara_api.run_job(
+        operation="network_data.extract_cut_points",
+        inputs={"network_data": network_data},
+    )
+    nodes = results.get_value_data("network_data").nodes.arrow_table
+    return dict(
+        zip(
+            nodes.column(NODE_ID_COLUMN_NAME).to_pylist(),
+            nodes.column(IS_CUTPOINT_COLUMN_NAME).to_pylist(),
+        )
+    )
+
+
+def test_cut_points(kiara_api: KiaraAPI):
+
+    network_data = create_network_data(edges=[(0, 1), (1, 2)], num_nodes=3)
+
+    cut_points = extract_cut_points(kiara_api, network_data)
+    assert cut_points == {0: False, 1: True, 2: False}
+
+
+def test_cut_points_without_cut_points(kiara_api: KiaraAPI):
+
+    network_data = create_network_data(edges=[(0, 1), (1, 2), (2, 0)], num_nodes=3)
+
+    cut_points = extract_cut_points(kiara_api, network_data)
+    assert cut_points == {0: False, 1: False, 2: False}
+
+
+def test_calculate_components(kiara_api: KiaraAPI):
+
+    # a larger component (0, 1, 2), a smaller one (3, 4), and an isolated node (5)
+    network_data = create_network_data(edges=[(0, 1), (1, 2), (3, 4)], num_nodes=6)
+
+    results = kiara_api.run_job(
+        operation="network_data.calculate_components",
+        inputs={"network_data": network_data},
+    )
+    assert results.get_value_data("number_of_components") == 3
+    assert results.get_value_data("is_connected") is False
+
+    nodes = results.get_value_data("network_data").nodes.arrow_table
+    components = dict(
+        zip(
+            nodes.column(NODE_ID_COLUMN_NAME).to_pylist(),
+            nodes.column(COMPONENT_ID_COLUMN_NAME).to_pylist(),
+        )
+    )
+    assert components == {0: 0, 1: 0, 2: 0, 3: 1, 4: 1, 5: 2}
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+from typing import List, Tuple
+
+import polars as pl
+import pyarrow as pa
+import pytest
+
+from kiara.exceptions import FailedJobException, KiaraProcessingException
+from kiara.interfaces.python_api import KiaraAPI
+from kiara_plugin.network_analysis.defaults import (
+    LABEL_COLUMN_NAME,
+    NODE_ID_COLUMN_NAME,
+    SOURCE_COLUMN_NAME,
+    TARGET_COLUMN_NAME,
+)
+from kiara_plugin.network_analysis.models import NetworkData
+from kiara_plugin.network_analysis.modules.create import (
+    OLD_NODE_ID_COLUMN_NAME,
+    add_column_mapping,
+    find_column_by_alias,
+    map_node_ids,
+)
+
+
+def assemble_network_data(kiara_api: KiaraAPI, **inputs) -> NetworkData:
+
+    results = kiara_api.run_job(operation="assemble.network_data", inputs=inputs)
+    return results.get_value_data("network_data")
+
+
+def edge_labels(network_data: NetworkData) -> List[Tuple[str, str]]:
+    """Return the (sorted) edges of the network data, as pairs of source and target node labels."""
+
+    nodes = network_data.nodes.arrow_table
+    labels = dict(
+        zip(
+            nodes.column(NODE_ID_COLUMN_NAME).to_pylist(),
+            nodes.column(LABEL_COLUMN_NAME).to_pylist(),
+        )
+    )
+    edges = network_data.edges.arrow_table
+    return sorted(
+        (labels[source], labels[target])
+        for source, target in zip(
+            edges.column(SOURCE_COLUMN_NAME).to_pylist(),
+            edges.column(TARGET_COLUMN_NAME).to_pylist(),
+        )
+    )
+
+
+def test_map_node_ids():
+
+    node_id_map = pl.DataFrame(
+        [
+            pl.Series(OLD_NODE_ID_COLUMN_NAME, [30, 10, 20], dtype=pl.Int64),
+            pl.Series(NODE_ID_COLUMN_NAME, [0, 1, 2], dtype=pl.Int64),
+        ]
+    )
+
+    node_ids = pl.Series("source", [10, 20, 30, 10, 40], dtype=pl.Int32)
+    mapped = map_node_ids(node_ids, node_id_map)
+
+    assert mapped.to_list() == [1, 2, 0, 1, None]
+
+
+def test_assemble_network_data_with_reserved_column_names(kiara_api: KiaraAPI):
+
+    nodes = pa.table({"id": [10, 20, 30], "label": ["a", "b", "c"]})
+    edges = pa.table(
+        {SOURCE_COLUMN_NAME: [10, 20, 30], TARGET_COLUMN_NAME: [20, 30, 10]}
+    )
+
+    network_data = assemble_network_data(
+        kiara_api,
+        nodes=nodes,
+        edges=edges,
+        source_column=SOURCE_COLUMN_NAME,
+        target_column=TARGET_COLUMN_NAME,
+    )
+
+    node_ids = network_data.nodes.arrow_table.column(NODE_ID_COLUMN_NAME)
+    assert sorted(node_ids.to_pylist()) == [0, 1, 2]
+    assert edge_labels(network_data) == [("a", "b"), ("b", "c"), ("c", "a")]
+
+
+def test_assemble_network_data_with_different_id_types(kiara_api: KiaraAPI):
+
+    nodes = pa.table(
+        {"id": pa.array([10, 20, 30], type=pa.int64()), "label": ["a", "b", "c"]}
+    )
+    edges = pa.table(
+        {
+            "source": pa.array([10, 20], type=pa.int32()),
+            "target": pa.array([20, 30], type=pa.int32()),
+        }
+    )
+
+    network_data = assemble_network_data(kiara_api, nodes=nodes, edges=edges)
+
+    assert edge_labels(network_data) == [("a", "b"), ("b", "c")]
+
+
+@pytest.mark.parametrize(
+    "column_names, aliases, expected",
+    [
+        (["Id", "Label"], ["id", "node_id"], "Id"),
+        (["weight", "NODE_ID", "id"], ["id", "node_id"], "NODE_ID"),
+        (["weight", "label"], ["id", "node_id"], None),
+        ([], ["id"], None),
+    ],
+)
+def test_find_column_by_alias(column_names, aliases, expected):
+
+    assert find_column_by_alias(column_names, aliases) == expected
+
+
+def test_add_column_mapping():
+
+    column_map = {"weight": "edge_weight"}
+    result = add_column_mapping(
+        column_map, "from", SOURCE_COLUMN_NAME, "source", "edges_column_map"
+    )
+
+    assert result == {"weight": "edge_weight", "from": SOURCE_COLUMN_NAME}
+    # the provided map is input data, and must not be modified
+    assert column_map == {"weight": "edge_weight"}
+
+    # an existing, matching mapping is fine
+    unchanged = add_column_mapping(
+        result, "from", SOURCE_COLUMN_NAME, "source", "edges_column_map"
+    )
+    assert unchanged == result
+
+
+def test_add_conflicting_column_mapping():
+
+    with pytest.raises(KiaraProcessingException):
+        add_column_mapping(
+            {"id": "node"}, "id", NODE_ID_COLUMN_NAME, "id", "nodes_column_map"
+        )
+
+
+def test_assemble_network_data_with_conflicting_id_mapping(kiara_api: KiaraAPI):
+
+    nodes = pa.table({"id": [10, 20], "label": ["a", "b"]})
+    edges = pa.table({"source": [10], "target": [20]})
+
+    # the module raises a 'KiaraProcessingException', which is wrapped by the job runner
+    with pytest.raises(
+        FailedJobException, match="Existing mapping of id column name 'id'"
+    ):
+        assemble_network_data(
+            kiara_api, nodes=nodes, edges=edges, nodes_column_map={"id": "node"}
+        )
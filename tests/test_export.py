@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from pyarrow import csv
+
+from kiara_plugin.network_analysis.defaults import (
+    EDGES_TABLE_NAME,
+    LABEL_COLUMN_NAME,
+    NODE_ID_COLUMN_NAME,
+    NODES_TABLE_NAME,
+    SOURCE_COLUMN_NAME,
+    TARGET_COLUMN_NAME,
+)
+from kiara_plugin.network_analysis.models import NetworkData
+from kiara_plugin.network_analysis.modules.export import (
+    stringify_nested_columns,
+    write_csv_table,
+    write_parquet_table,
+    write_tables,
+)
+
+
+@pytest.fixture
+def network_data() -> NetworkData:
+
+    nodes = pa.table({NODE_ID_COLUMN_NAME: [0, 1], LABEL_COLUMN_NAME: ["a", "b"]})
+    edges = pa.table(
+        {
+            SOURCE_COLUMN_NAME: [0, 1],
+            TARGET_COLUMN_NAME: [1, 0],
+            "times": [["t1", "t2"], None],
+        }
+    )
+    return NetworkData.create_network_data(
+        nodes_table=nodes, edges_table=edges, augment_tables=False
+    )
+
+
+def test_stringify_nested_columns():
+
+    table = pa.table(
+        {
+            "number": [1, 2],
+            "numbers": [[1, 2], None],
+            "struct": [{"x": 1}, {"x": 2}],
+        }
+    )
+    result = stringify_nested_columns(table)
+
+    assert result.column_names == ["number", "numbers", "struct"]
+    assert result.column("number").to_pylist() == [1, 2]
+    assert result.schema.field("numbers").type == pa.string()
+    assert result.schema.field("struct").type == pa.string()
+
+    numbers = result.column("numbers").to_pylist()
+    assert json.loads(numbers[0]) == [1, 2]
+    assert numbers[1] is None
+    assert [json.loads(x) for x in result.column("struct").to_pylist()] == [
+        {"x": 1},
+        {"x": 2},
+    ]
+
+
+def test_export_csv_files(network_data: NetworkData, tmp_path):
+
+    files = write_tables(
+        network_data,
+        base_path=str(tmp_path),
+        name="network",
+        extension="csv",
+        write_table=write_csv_table,
+    )
+
+    edges_file = os.path.join(tmp_path, f"network__{EDGES_TABLE_NAME}.csv")
+    nodes_file = os.path.join(tmp_path, f"network__{NODES_TABLE_NAME}.csv")
+    assert sorted(files) == sorted([edges_file, nodes_file])
+
+    nodes = csv.read_csv(nodes_file)
+    assert nodes.column(LABEL_COLUMN_NAME).to_pylist() == ["a", "b"]
+
+    edges = csv.read_csv(
+        edges_file, convert_options=csv.ConvertOptions(strings_can_be_null=True)
+    )
+    assert edges.column(SOURCE_COLUMN_NAME).to_pylist() == [0, 1]
+    assert json.loads(edges.column("times")[0].as_py()) == ["t1", "t2"]
+    assert edges.column("times")[1].as_py() is None
+
+
+def test_export_parquet_files(network_data: NetworkData, tmp_path):
+
+    files = write_tables(
+        network_data,
+        base_path=str(tmp_path),
+        name="network",
+        extension="parquet",
+        write_table=write_parquet_table,
+    )
+    assert len(files) == 2
+
+    for table_name, table in network_data.tables.items():
+        target_path = os.path.join(tmp_path, f"network__{table_name}.parquet")
+        assert target_path in files
+        assert pq.read_table(target_path).equals(table.arrow_table)
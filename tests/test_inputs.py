@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from kiara_plugin.core_types.defaults import DEFAULT_MODEL_KEY
+from kiara_plugin.network_analysis.models.inputs import (
+    AttributeMapStrategy,
+    parse_attribute_map_token,
+)
+
+
+@pytest.mark.parametrize(
+    "token, expected",
+    [
+        ("weight", ("weight", "weight", None)),
+        ("new_weight=weight", ("new_weight", "weight", None)),
+        ("new_weight= weight ", ("new_weight", "weight", None)),
+        ("new_weight=", ("new_weight", "new_weight", None)),
+        ("sum_weight=SUM(weight)", ("sum_weight", "weight", "sum")),
+        ("sum_weight= Sum ( weight ) ", ("sum_weight", "weight", "sum")),
+    ],
+)
+def test_parse_attribute_map_token(token, expected):
+
+    result = parse_attribute_map_token(token)
+    assert (
+        result["target_column_name"],
+        result["source_column_name"],
+        result["transform_function"],
+    ) == expected
+
+
+@pytest.mark.parametrize("token", ["sum_weight=SUM(weight", "sum_weight=SUM()"])
+def test_parse_invalid_attribute_map_token(token):
+
+    with pytest.raises(ValueError):
+        parse_attribute_map_token(token)
+
+
+def test_attribute_map_strategy_from_shorthand():
+
+    strategy = AttributeMapStrategy.model_validate(
+        {DEFAULT_MODEL_KEY: "sum_weight=SUM(weight)"}
+    )
+    assert strategy.target_column_name == "sum_weight"
+    assert strategy.source_column_name == "weight"
+    assert strategy.transform_function == "sum"
+
+    # the transform function is still validated
+    with pytest.raises(ValueError):
+        AttributeMapStrategy.model_validate({DEFAULT_MODEL_KEY: "x=INVALID(weight)"})
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+from typing import Any, Dict, List
+
+import pyarrow as pa
+import pytest
+
+from kiara.interfaces.python_api import KiaraAPI
+from kiara_plugin.network_analysis.defaults import (
+    LABEL_COLUMN_NAME,
+    NODE_ID_COLUMN_NAME,
+    SOURCE_COLUMN_NAME,
+    TARGET_COLUMN_NAME,
+)
+from kiara_plugin.network_analysis.models import NetworkData
+
+
+@pytest.fixture
+def multi_network_data() -> NetworkData:
+
+    nodes = pa.table(
+        {NODE_ID_COLUMN_NAME: [0, 1, 2], LABEL_COLUMN_NAME: ["a", "b", "c"]}
+    )
+    edges = pa.table(
+        {
+            SOURCE_COLUMN_NAME: [0, 0, 1, 2],
+            TARGET_COLUMN_NAME: [1, 1, 2, 0],
+            "weight": pa.array([1, 2, 3, 4], type=pa.int64()),
+            "time": ["t1", "t2", "t3", "t4"],
+        }
+    )
+    return NetworkData.create_network_data(nodes_table=nodes, edges_table=edges)
+
+
+def redefine_edges(
+    kiara_api: KiaraAPI, network_data: NetworkData, attributes: List[Dict[str, Any]]
+) -> "pa.Table":
+
+    results = kiara_api.run_job(
+        operation="network_data.redefine_edges",
+        inputs={"network_data": network_data, "attributes": attributes},
+    )
+    new_network_data: NetworkData = results.get_value_data("network_data")
+    return new_network_data.edges.arrow_table
+
+
+def test_redefine_edges_sum(kiara_api: KiaraAPI, multi_network_data: NetworkData):
+
+    sum_weight = {
+        "target_column_name": "sum_weight",
+        "source_column_name": "weight",
+        "transform_function": "sum",
+    }
+    edges = redefine_edges(kiara_api, multi_network_data, [sum_weight])
+
+    assert edges.num_rows == 3
+    sums = dict(
+        zip(
+            zip(
+                edges.column(SOURCE_COLUMN_NAME).to_pylist(),
+                edges.column(TARGET_COLUMN_NAME).to_pylist(),
+            ),
+            edges.column("sum_weight").to_pylist(),
+        )
+    )
+    assert sums == {(0, 1): 3, (1, 2): 3, (2, 0): 4}
+
+
+def test_redefine_edges_column_types_are_stable(
+    kiara_api: KiaraAPI, multi_network_data: NetworkData
+):
+    """The type of an aggregated column must not depend on the other requested aggregations."""
+
+    sum_weight = {
+        "target_column_name": "sum_weight",
+        "source_column_name": "weight",
+        "transform_function": "sum",
+    }
+    list_time = {
+        "target_column_name": "times",
+        "source_column_name": "time",
+        "transform_function": "list",
+    }
+
+    edges_sum_only = redefine_edges(kiara_api, multi_network_data, [sum_weight])
+    edges_with_list = redefine_edges(
+        kiara_api, multi_network_data, [sum_weight, list_time]
+    )
+
+    assert (
+        edges_sum_only.schema.field("sum_weight").type
+        == edges_with_list.schema.field("sum_weight").type
+    )